@@ -1,170 +1,541 @@
 # sat_solver_benchmark.py
 import time
-import random
+import heapq
+import itertools
 import argparse
 import os
-import matplotlib.pyplot as plt
+import re
+import mmap
 import csv
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the hot loops then run as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 
 # ------------------ CNF Parser ------------------ #
-def parse_dimacs(filename):
-    clauses = []
+def parse_dimacs_csr(filename):
     num_vars = 0
-    with open(filename, 'r') as f:
-        for line in f:
-            if line.startswith('c'):
-                continue
-            elif line.startswith('p cnf'):
-                num_vars = int(line.split()[2])
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map an empty file
+            return np.zeros(0, dtype=np.int32), np.zeros(1, dtype=np.int32), 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            offset = 0
+            while mm[offset:offset + 1] in (b'c', b'p'):
+                end = mm.find(b'\n', offset)
+                if end < 0:
+                    end = len(mm)
+                line = mm[offset:end]
+                if line.startswith(b'p cnf'):
+                    num_vars = int(line.split()[2])
+                offset = end + 1
+            body = mm[offset:]
+
+    # SATLIB files end with a '%' line followed by a stray 0; comments may
+    # also appear between clauses
+    trailer = re.search(rb'(?m)^%', body)
+    if trailer:
+        body = body[:trailer.start()]
+    body = re.sub(rb'(?m)^c.*$', b'', body)
+
+    # Whitespace (including newlines) separates the tokens; a blank body
+    # would otherwise parse as a single 0, i.e. an empty clause
+    arr = np.fromstring(body, sep=' ', dtype=np.int32) if body.strip() else np.zeros(0, dtype=np.int32)
+
+    # Clause i ends at zero_idx[i], after i earlier terminating zeros
+    zero_idx = np.flatnonzero(arr == 0)
+    lits = arr[arr != 0]
+    if arr.size and num_vars == 0:
+        raise ValueError(f"{filename}: clauses without a 'p cnf' header")
+    if lits.size and np.abs(lits).max() > num_vars:
+        raise ValueError(f"{filename}: literal {np.abs(lits).max()} exceeds the {num_vars} variables in the header")
+    starts = np.concatenate([[0], zero_idx - np.arange(len(zero_idx))]).astype(np.int32)
+    if len(lits) > starts[-1]:
+        # The last clause was not terminated by a 0
+        starts = np.append(starts, np.int32(len(lits)))
+    return lits, starts, num_vars
+
+
+def parse_dimacs(filename):
+    lits, starts, num_vars = parse_dimacs_csr(filename)
+    return csr_to_clauses(lits, starts), num_vars
+
+
+# ------------------ Bitmask Clauses ------------------ #
+def to_bitmasks(clauses):
+    # Variable v maps to bit v-1; a clause becomes (pos_mask, neg_mask)
+    pos, neg = [], []
+    for clause in clauses:
+        p = n = 0
+        for lit in clause:
+            if lit > 0:
+                p |= 1 << (lit - 1)
             else:
-                clause = list(map(int, line.strip().split()))
-                if clause[-1] == 0:
-                    clause = clause[:-1]
-                clauses.append(clause)
-    return clauses, num_vars
+                n |= 1 << (-lit - 1)
+        pos.append(p)
+        neg.append(n)
+    return pos, neg
+
+
+def to_words(masks, num_words):
+    # Splits each mask into num_words uint64 words, least significant first
+    words = np.empty((len(masks), num_words), dtype=np.uint64)
+    for w in range(num_words):
+        words[:, w] = [(mask >> (64 * w)) & 0xFFFFFFFFFFFFFFFF for mask in masks]
+    return words
+
+
+# ------------------ CSR Clause Arrays ------------------ #
+def to_csr(clauses):
+    # Clause i occupies lits[starts[i]:starts[i + 1]]
+    starts = np.zeros(len(clauses) + 1, dtype=np.int32)
+    starts[1:] = np.cumsum([len(clause) for clause in clauses])
+    lits = np.fromiter((lit for clause in clauses for lit in clause), dtype=np.int32, count=starts[-1])
+    return lits, starts
+
+
+def csr_to_clauses(lits, starts):
+    return [clause.tolist() for clause in np.split(lits[:starts[-1]], starts[1:-1])] if len(starts) > 1 else []
+
+
+def to_occurrences(lits, starts, num_vars):
+    # Clauses containing literal l are occurs[occ_starts[i]:occ_starts[i + 1]]
+    # with i = 2 * |l| + (l < 0)
+    lit_idx = 2 * np.abs(lits) + (lits < 0)
+    clause_of = np.repeat(np.arange(len(starts) - 1, dtype=np.int32), np.diff(starts))
+    occurs = clause_of[np.argsort(lit_idx, kind='stable')]
+    occ_starts = np.zeros(2 * num_vars + 3, dtype=np.int32)
+    occ_starts[1:] = np.cumsum(np.bincount(lit_idx, minlength=2 * num_vars + 2))
+    return occurs, occ_starts
+
+
+@njit(cache=True, boundscheck=False)
+def propagate(lits, starts, occurs, occ_starts, assign, trail, qhead, trail_len):
+    # assign[var] is +1 (True), -1 (False) or 0 (unassigned). trail[qhead:trail_len]
+    # is the propagation queue; only clauses containing the negation of a queued
+    # literal are rescanned and implied literals are pushed onto the trail.
+    # Returns (conflicting clause id or -1, trail_len).
+    while qhead < trail_len:
+        false_lit = -trail[qhead]
+        qhead += 1
+        idx = 2 * abs(false_lit) + (false_lit < 0)
+        for j in range(occ_starts[idx], occ_starts[idx + 1]):
+            cid = occurs[j]
+            unassigned = 0
+            last = 0
+            satisfied = False
+            for k in range(starts[cid], starts[cid + 1]):
+                lit = lits[k]
+                val = assign[abs(lit)]
+                if val == 0:
+                    unassigned += 1
+                    last = lit
+                elif (val > 0) == (lit > 0):
+                    satisfied = True
+                    break
+            if satisfied:
+                continue
+            if unassigned == 0:
+                return cid, trail_len
+            if unassigned == 1:
+                assign[abs(last)] = 1 if last > 0 else -1
+                trail[trail_len] = last
+                trail_len += 1
+    return -1, trail_len
 
 
 # ------------------ Davis-Putnam (DP) ------------------ #
 def dp(clauses, symbols):
-    if not clauses:
-        return True
-    if any([clause == [] for clause in clauses]):
-        return False
-
-    symbol = symbols[0]
-    rest = symbols[1:]
-
-    def assign(value):
-        new_clauses = []
-        for clause in clauses:
-            if symbol * value in clause:
-                continue
-            new_clause = [x for x in clause if x != -symbol * value]
-            new_clauses.append(new_clause)
-        return new_clauses
-
-    return dp(assign(1), rest) or dp(assign(-1), rest)
+    # Clause masks are split into uint64 words stored word-major, (num_words, num_clauses):
+    # variable v is bit (v - 1) % 64 of word (v - 1) // 64, so any variable count
+    # stays on machine words and per-clause reductions run along the fast axis
+    num_bits = max(symbols, default=0)
+    num_words = max(1, -(-num_bits // 64))
+    shifts = np.arange(64, dtype=np.uint64)
+    pos_masks, neg_masks = to_bitmasks(clauses)
+    # x or -x is always satisfied; left in, its single-bit width would read as
+    # a unit clause forcing x both ways
+    kept = [i for i, (p, n) in enumerate(zip(pos_masks, neg_masks)) if not p & n]
+    pos = to_words([pos_masks[i] for i in kept], num_words).T.copy()
+    neg = to_words([neg_masks[i] for i in kept], num_words).T.copy()
+
+    # Scratch buffers reused by every propagation round instead of fresh arrays
+    num_clauses = pos.shape[1]
+    open_pos = np.empty((num_words, num_clauses), dtype=np.uint64)
+    open_neg = np.empty((num_words, num_clauses), dtype=np.uint64)
+    width = np.empty((num_words, num_clauses), dtype=np.uint64)
+    scratch = np.empty((num_words, num_clauses), dtype=np.uint64)
+    is_open = np.empty(num_clauses, dtype=bool)
+    flag = np.empty(num_clauses, dtype=bool)
+
+    def reduce(true_bits, false_bits):
+        # Marks clauses not yet satisfied in is_open and restricts every clause
+        # to its unassigned variables in open_pos/open_neg/width
+        np.bitwise_and(pos, true_bits, out=width)
+        np.bitwise_and(neg, false_bits, out=scratch)
+        np.bitwise_or(width, scratch, out=width)
+        np.logical_or.reduce(width, axis=0, out=is_open)
+        np.logical_not(is_open, out=is_open)
+        free = ~(true_bits | false_bits)
+        np.bitwise_and(pos, free, out=open_pos)
+        np.bitwise_and(neg, free, out=open_neg)
+        np.bitwise_or(open_pos, open_neg, out=width)
+
+    def jeroslow_wang(pos, neg):
+        # Each clause adds 2^-len to the score of its literals
+        pos_member = ((pos.T[:, :, None] >> shifts) & 1).astype(bool).reshape(pos.shape[1], -1)[:, :num_bits]
+        neg_member = ((neg.T[:, :, None] >> shifts) & 1).astype(bool).reshape(neg.shape[1], -1)[:, :num_bits]
+        weights = 2.0 ** -(pos_member.sum(axis=1) + neg_member.sum(axis=1))
+        return weights @ pos_member, weights @ neg_member
+
+    # The whole assignment is two word arrays, so undoing a decision restores two references
+    true_bits = false_bits = np.zeros((num_words, 1), dtype=np.uint64)
+    decisions = []      # (true_bits, false_bits, bit, value, flipped) before each decision
+    while True:
+        # Unit propagation and pure-literal elimination until a fixpoint
+        conflict = False
+        while True:
+            reduce(true_bits, false_bits)
+            if not np.count_nonzero(is_open):
+                return True
+            np.logical_or.reduce(width, axis=0, out=flag)
+            np.logical_not(flag, out=flag)
+            flag &= is_open
+            if np.count_nonzero(flag):
+                conflict = True
+                break
+            # A unit clause has a single nonzero word, and that word is a power of two
+            np.subtract(width, 1, out=scratch)
+            np.bitwise_and(width, scratch, out=scratch)
+            np.logical_or.reduce(scratch, axis=0, out=flag)
+            np.logical_not(flag, out=flag)
+            flag &= is_open
+            if num_words > 1:
+                flag &= np.count_nonzero(width, axis=0) == 1
+            if np.count_nonzero(flag):
+                new_true = np.bitwise_or.reduce(open_pos, axis=1, where=flag, initial=0, keepdims=True)
+                new_false = np.bitwise_or.reduce(open_neg, axis=1, where=flag, initial=0, keepdims=True)
+                if np.count_nonzero(new_true & new_false):
+                    conflict = True
+                    break
+            else:
+                all_pos = np.bitwise_or.reduce(open_pos, axis=1, where=is_open, initial=0, keepdims=True)
+                all_neg = np.bitwise_or.reduce(open_neg, axis=1, where=is_open, initial=0, keepdims=True)
+                new_true = all_pos & ~all_neg
+                new_false = all_neg & ~all_pos
+                if not np.count_nonzero(new_true | new_false):
+                    break
+            true_bits = true_bits | new_true
+            false_bits = false_bits | new_false
+
+        if conflict:
+            # Undo decisions that already tried both values, then flip the latest one
+            while decisions and decisions[-1][4]:
+                decisions.pop()
+            if not decisions:
+                return False
+            true_bits, false_bits, bit, value, _ = decisions.pop()
+            value = not value
+            decisions.append((true_bits, false_bits, bit, value, True))
+        else:
+            jw_pos, jw_neg = jeroslow_wang(open_pos[:, is_open], open_neg[:, is_open])
+            var = int(np.argmax(jw_pos + jw_neg))
+            bit = np.zeros((num_words, 1), dtype=np.uint64)
+            bit[var // 64, 0] = 1 << (var % 64)
+            value = jw_pos[var] >= jw_neg[var]
+            decisions.append((true_bits, false_bits, bit, value, False))
+
+        if value:
+            true_bits = true_bits | bit
+        else:
+            false_bits = false_bits | bit
 
 
 # ------------------ DPLL ------------------ #
-def dpll(clauses, assignment={}):
-    # Clause is satisfied if at least one literal evaluates True
-    if all(any(assignment.get(abs(lit), None) == (lit > 0) for lit in clause) for clause in clauses):
+def dpll(clauses, num_vars):
+    clauses = [list(clause) for clause in clauses]
+    # Lists indexed directly by literal: negative literals land in the upper
+    # half through negative indexing, so the hot loop needs no abs() or sign test
+    values = [0] * (2 * num_vars + 1)   # 1 = True, -1 = False, 0 = unassigned
+    watches = [[] for _ in range(2 * num_vars + 1)]
+    trail = []          # assigned literals in order
+    trail_lim = []      # trail index where each decision level starts
+    flipped = []        # whether each decision has already tried both values
+
+    def enqueue(lit):
+        val = values[lit]
+        if val:
+            return val > 0
+        values[lit] = 1
+        values[-lit] = -1
+        trail.append(lit)
         return True
-    
-    # Clause is unsatisfied if all literals evaluate False
-    if any(all(assignment.get(abs(lit), None) == (lit < 0) for lit in clause if abs(lit) in assignment) and
-           all(abs(lit) in assignment for lit in clause)
-           for clause in clauses):
-        return False
-               
-    unassigned = {abs(lit) for clause in clauses for lit in clause} - assignment.keys()
-    if not unassigned:
+
+    def propagate(qhead):
+        # Bind to locals so the loop below reads fast locals, not closure cells
+        local_values, local_watches, local_clauses, local_trail = values, watches, clauses, trail
+
+        # Only clauses watching the negation of a newly true literal are visited
+        while qhead < len(local_trail):
+            false_lit = -local_trail[qhead]
+            qhead += 1
+            watching = local_watches[false_lit]
+            i = 0
+            while i < len(watching):
+                clause = local_clauses[watching[i]]
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], clause[0]
+                first = clause[0]
+                if local_values[first] == 1:
+                    i += 1
+                    continue
+                for k in range(2, len(clause)):
+                    if local_values[clause[k]] != -1:
+                        clause[1], clause[k] = clause[k], clause[1]
+                        local_watches[clause[1]].append(watching[i])
+                        watching[i] = watching[-1]
+                        watching.pop()
+                        break
+                else:
+                    i += 1
+                    if local_values[first] == -1:
+                        return False
+                    local_values[first] = 1
+                    local_values[-first] = -1
+                    local_trail.append(first)
         return True
 
-    var = unassigned.pop()
-    for val in [True, False]:
-        assignment[var] = val
-        assignment[-var] = not val
-        if dpll(clauses, assignment):
-            return True
-        del assignment[var]
-        del assignment[-var]
-    return False
+    def backtrack(level):
+        while len(trail) > trail_lim[level]:
+            lit = trail.pop()
+            values[lit] = 0
+            values[-lit] = 0
+        del trail_lim[level:]
+        del flipped[level:]
+
+    for cid, clause in enumerate(clauses):
+        if not clause:
+            return False
+        if len(clause) == 1:
+            if not enqueue(clause[0]):
+                return False
+        else:
+            watches[clause[0]].append(cid)
+            watches[clause[1]].append(cid)
+
+    qhead = 0
+    while True:
+        if propagate(qhead):
+            try:
+                var = values.index(0, 1, num_vars + 1)
+            except ValueError:
+                return True
+            trail_lim.append(len(trail))
+            flipped.append(False)
+            enqueue(var)
+        else:
+            # Undo decisions that already tried both values, then flip the latest one
+            while flipped and flipped[-1]:
+                backtrack(len(trail_lim) - 1)
+            if not trail_lim:
+                return False
+            lit = trail[trail_lim[-1]]
+            backtrack(len(trail_lim) - 1)
+            trail_lim.append(len(trail))
+            flipped.append(True)
+            enqueue(-lit)
+        qhead = trail_lim[-1] if trail_lim else 0
 
 
 # ------------------ CDCL (Simplified) ------------------ #
-def cdcl(clauses, num_vars):
-    assignment = {}
-    decision_level = 0
-
-    def unit_propagate():
-        changed = True
-        while changed:
-            changed = False
-            for clause in clauses:
-                unassigned = [l for l in clause if abs(l) not in assignment]
-                if len(unassigned) == 1:
-                    lit = unassigned[0]
-                    assignment[abs(lit)] = lit > 0
-                    changed = True
-                elif all(assignment.get(abs(l), l < 0) == (l < 0) for l in clause):
-                    return False
-        return True
+VSIDS_BUMP = 1.0
+VSIDS_DECAY_FACTOR = 0.95
+VSIDS_DECAY_INTERVAL = 16   # conflicts between activity decays
+
+
+def cdcl(clauses, num_vars, seed=None):
+    return cdcl_csr(to_csr(clauses), num_vars, seed)
+
+
+def cdcl_csr(csr, num_vars, seed=None):
+    # Same solver on prebuilt (lits, starts) arrays, e.g. from parse_dimacs_csr()
+    lits, starts = csr
+    occurs, occ_starts = to_occurrences(lits, starts, num_vars)
+    assignment = np.zeros(num_vars + 1, dtype=np.int8)
+    trail = np.zeros(num_vars, dtype=np.int32)
+    trail_len = 0
+    trail_lim = []      # trail index where each decision level starts
+    polarity = np.random.default_rng(seed).integers(0, 2, size=num_vars + 1)   # random phase per variable
+    activity = np.zeros(num_vars + 1, dtype=np.float64)
+    heap = [(0.0, var) for var in range(1, num_vars + 1)]
+    conflicts = 0
+
+    def assign(lit):
+        nonlocal trail_len
+        assignment[abs(lit)] = 1 if lit > 0 else -1
+        trail[trail_len] = lit
+        trail_len += 1
 
     def backtrack(level):
-        nonlocal assignment
-        assignment = {k: v for k, v in assignment.items() if k <= level}
+        nonlocal trail_len
+        while trail_len > trail_lim[level]:
+            trail_len -= 1
+            var = abs(trail[trail_len])
+            assignment[var] = 0
+            heapq.heappush(heap, (-activity[var], var))
+        del trail_lim[level:]
+
+    def bump(cid):
+        nonlocal heap, conflicts
+        for lit in lits[starts[cid]:starts[cid + 1]]:
+            var = abs(lit)
+            activity[var] += VSIDS_BUMP
+            heapq.heappush(heap, (-activity[var], var))
+        conflicts += 1
+        if conflicts % VSIDS_DECAY_INTERVAL == 0:
+            activity[:] *= VSIDS_DECAY_FACTOR
+            heap = [(-activity[var], var) for var in range(1, num_vars + 1) if assignment[var] == 0]
+            heapq.heapify(heap)
 
     def choose_literal():
-        for var in range(1, num_vars + 1):
-            if var not in assignment:
+        # Lazy deletion: skip assigned variables and entries with a stale activity
+        while heap:
+            key, var = heapq.heappop(heap)
+            if assignment[var] == 0 and key == -activity[var]:
                 return var
         return None
 
+    # Unit clauses seed the propagation queue; later rescans are driven by the trail
+    widths = np.diff(starts)
+    if np.any(widths == 0):
+        return False
+    for lit in lits[starts[:-1][widths == 1]].tolist():
+        val = assignment[abs(lit)]
+        if val == 0:
+            assign(lit)
+        elif (val > 0) != (lit > 0):
+            return False
+
+    qhead = 0
     while True:
-        if unit_propagate():
-            if all(any(assignment.get(abs(l), l > 0) == (l > 0) for l in clause) for clause in clauses):
-                return True
-            decision_level += 1
+        conflict, trail_len = propagate(lits, starts, occurs, occ_starts, assignment, trail, qhead, trail_len)
+        if conflict < 0:
             var = choose_literal()
             if var is None:
                 return True
-            assignment[var] = random.choice([True, False])
+            trail_lim.append(trail_len)
+            qhead = trail_len
+            assign(var if polarity[var] else -var)
         else:
-            if decision_level == 0:
+            if not trail_lim:
                 return False
-            backtrack(decision_level - 1)
-            decision_level -= 1
+            bump(conflict)
+            # The latest decision led to a conflict, so its negation is
+            # implied at the level below
+            lit = int(trail[trail_lim[-1]])
+            backtrack(len(trail_lim) - 1)
+            qhead = trail_len
+            assign(-lit)
+
+
+# ------------------ DIMACS Writer ------------------ #
+def write_dimacs(filename, num_vars, *blocks):
+    # Each block is a 2-D array of equal-width clauses
+    with open(filename, 'w') as f:
+        f.write(f"p cnf {num_vars} {sum(len(block) for block in blocks)}\n")
+        for block in blocks:
+            np.savetxt(f, np.hstack([block, np.zeros((len(block), 1), dtype=int)]), fmt='%d')
 
 
 # ------------------ Pigeonhole Principle Generator ------------------ #
-def generate_pigeonhole_cnf(n, filename='pigeonhole.cnf'):
-    clauses = []
-    vars_map = lambda p, h: p * n + h + 1
-
-    for p in range(n + 1):
-        clauses.append([vars_map(p, h) for h in range(n)])
+def generate_pigeonhole_cnf(n, filename=None):
+    # Variable p * n + h + 1 means pigeon p sits in hole h
+    num_vars = n * (n + 1)
+    at_least_one = np.arange(num_vars).reshape(n + 1, n) + 1
 
-    for h in range(n):
-        for p1 in range(n + 1):
-            for p2 in range(p1 + 1, n + 1):
-                clauses.append([-vars_map(p1, h), -vars_map(p2, h)])
+    p1, p2 = np.triu_indices(n + 1, 1)
+    pairs = np.stack([p1, p2], axis=1)
+    holes = np.arange(n)[:, None, None]
+    at_most_one = -(pairs * n + holes + 1).reshape(-1, 2)
 
-    with open(filename, 'w') as f:
-        f.write(f"p cnf {n * (n + 1)} {len(clauses)}\n")
-        for clause in clauses:
-            f.write(' '.join(map(str, clause)) + ' 0\n')
+    if filename:
+        write_dimacs(filename, num_vars, at_least_one, at_most_one)
+    return at_least_one.tolist() + at_most_one.tolist(), num_vars
 
 
 # ------------------ Random 3-SAT Generator ------------------ #
-def generate_random_3sat(num_vars, num_clauses, filename='random.cnf'):
-    clauses = []
-    for _ in range(num_clauses):
-        clause = random.sample(range(1, num_vars + 1), 3)
-        clause = [x if random.random() < 0.5 else -x for x in clause]
-        clauses.append(clause)
+def generate_random_3sat(num_vars, num_clauses, filename=None, seed=None):
+    rng = np.random.default_rng(seed)
+    # The 3 smallest random keys per row pick 3 distinct variables
+    keys = rng.random((num_clauses, num_vars))
+    idx = np.argpartition(keys, 2, axis=1)[:, :3] + 1
+    signs = rng.integers(0, 2, size=(num_clauses, 3)) * 2 - 1
+    clauses = idx * signs
 
-    with open(filename, 'w') as f:
-        f.write(f"p cnf {num_vars} {num_clauses}\n")
-        for clause in clauses:
-            f.write(' '.join(map(str, clause)) + ' 0\n')
+    if filename:
+        write_dimacs(filename, num_vars, clauses)
+    return clauses.tolist(), num_vars
 
 
 # ------------------ Benchmarking ------------------ #
-def benchmark_solver(solver, clauses, num_vars, name):
-    start = time.time()
+def warm_up_jit():
+    # Compile (or load from cache) propagate() so it is not part of any timing
+    cdcl([[1]], 1)
+
+
+def benchmark_solver(solver, clauses, num_vars, name, seed=None):
+    start = time.perf_counter()
     if name == "DP":
         result = solver(clauses, list(range(1, num_vars + 1)))
     elif name == "CDCL":
-        result = solver(clauses, num_vars)
+        result = solver(clauses, num_vars, seed)
     else:
-        result = solver(clauses, {})
-    duration = time.time() - start
+        result = solver(clauses, num_vars)
+    duration = time.perf_counter() - start
     return name, 'SAT' if result else 'UNSAT', duration
 
 
+# ------------------ Self-Check ------------------ #
+def brute_force(clauses, num_vars):
+    for bits in itertools.product((False, True), repeat=num_vars):
+        if all(any(bits[abs(lit) - 1] == (lit > 0) for lit in clause) for clause in clauses):
+            return True
+    return False
+
+
+def self_check(trials=300, seed=0):
+    # Cross-checks every solver against brute force on small random formulas.
+    # Variables may repeat within a clause, so tautologies (x or -x) and
+    # duplicate literals are covered.
+    check_rng = np.random.default_rng(seed)
+    formulas = [([[5, -3, -5], [2], [-6, 6], [1], [-4, 3], [-6]], 7)]
+    for _ in range(trials):
+        num_vars = int(check_rng.integers(1, 9))
+        clauses = []
+        for _ in range(int(check_rng.integers(1, 30))):
+            width = int(check_rng.integers(1, 4))
+            lits = check_rng.integers(1, num_vars + 1, size=width) * check_rng.choice([-1, 1], size=width)
+            clauses.append(lits.tolist())
+        formulas.append((clauses, num_vars))
+
+    failures = 0
+    for clauses, num_vars in formulas:
+        expected = brute_force(clauses, num_vars)
+        for name, result in [("DP", dp(clauses, list(range(1, num_vars + 1)))),
+                             ("DPLL", dpll(clauses, num_vars)),
+                             ("CDCL", cdcl(clauses, num_vars))]:
+            if result != expected:
+                failures += 1
+                print(f"{name} returned {'SAT' if result else 'UNSAT'} for {clauses}")
+    print(f"Self-check: {failures} mismatches over {len(formulas)} formulas")
+    return failures == 0
+
+
 # ------------------ Visualization in PDF ------------------ #
 
 # def plot_results(results, filename="benchmark_plot.pdf"):
@@ -185,6 +556,9 @@ def benchmark_solver(solver, clauses, num_vars, name):
 # ------------ SHOW GRID ON SCREEN ------------ #
 
 def plot_results(results):
+    # Imported here so runs without a plot skip loading matplotlib
+    import matplotlib.pyplot as plt
+
     for solver_name, timings in results.items():
         sizes = [x[0] for x in timings]
         times = [x[1] for x in timings]
@@ -201,69 +575,88 @@ def plot_results(results):
 # ------------------ Export to LaTeX ------------------ #
 
 def export_results(results, csv_file="benchmark_results.csv", tex_file="benchmark_table.tex"):
+    # Pivot once into size -> solver -> formatted time
+    sizes = sorted({size for timing in results.values() for size, _ in timing})
+    pivot = {size: {} for size in sizes}
+    for solver, timings in results.items():
+        for size, time_val in timings:
+            pivot[size][solver] = f"{time_val:.6f}"
+    rows = [[str(size)] + [pivot[size].get(solver, "N/A") for solver in ["DP", "DPLL", "CDCL"]] for size in sizes]
+
     with open(csv_file, "w", newline="") as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(["Problem Size", "DP Time (s)", "DPLL Time (s)", "CDCL Time (s)"])
-
-        sizes = sorted({size for timing in results.values() for size, _ in timing})
-        for size in sizes:
-            row = [size]
-            for solver in ["DP", "DPLL", "CDCL"]:
-                time_val = next((t for s, t in results[solver] if s == size), "N/A")
-                row.append(f"{time_val:.6f}" if isinstance(time_val, float) else time_val)
-            writer.writerow(row)
+        writer.writerows(rows)
 
     with open(tex_file, "w") as tex:
-        tex.write("\\begin{table}[H]\n\\centering\n")
-        tex.write("\\begin{tabular}{|c|c|c|c|}\n\\hline\n")
-        tex.write("Problem Size & DP Time (s) & DPLL Time (s) & CDCL Time (s) \\\\\n\\hline\n")
-
-        for size in sizes:
-            row = [str(size)]
-            for solver in ["DP", "DPLL", "CDCL"]:
-                time_val = next((t for s, t in results[solver] if s == size), "N/A")
-                row.append(f"{time_val:.6f}" if isinstance(time_val, float) else time_val)
-            tex.write(" & ".join(row) + " \\\\\n")
-
-        tex.write("\\hline\n\\end{tabular}\n")
-        tex.write("\\caption{Benchmark results for SAT solvers}\n")
-        tex.write("\\label{tab:sat_benchmarks}\n")
-        tex.write("\\end{table}\n")
+        tex.write("\\begin{table}[H]\n\\centering\n"
+                  "\\begin{tabular}{|c|c|c|c|}\n\\hline\n"
+                  "Problem Size & DP Time (s) & DPLL Time (s) & CDCL Time (s) \\\\\n\\hline\n"
+                  + "".join(" & ".join(row) + " \\\\\n" for row in rows)
+                  + "\\hline\n\\end{tabular}\n"
+                  "\\caption{Benchmark results for SAT solvers}\n"
+                  "\\label{tab:sat_benchmarks}\n"
+                  "\\end{table}\n")
     print(f"Exported benchmark results to {csv_file} and {tex_file}")
 
 
 # ------------------ Main ------------------ #
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
-    parser.add_argument("--test", choices=["pigeonhole", "3sat"], required=True)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--test", choices=["pigeonhole", "3sat"])
+    source.add_argument("--cnf", help="benchmark a single DIMACS file instead of generated instances")
+    source.add_argument("--self-check", action="store_true", help="check all solvers against brute force and exit")
     parser.add_argument("--min", type=int, default=2)
     parser.add_argument("--max", type=int, default=6)
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                        help="worker processes; concurrent solves compete for CPU, so use 1 for uncontended timings")
+    parser.add_argument("--seed", type=int, help="seed for instance generation and CDCL decisions")
+    parser.add_argument("--no-plot", action="store_true", help="skip the runtime plot")
+    parser.add_argument("--write-dimacs", action="store_true", help="also save each generated instance as a .cnf file")
     args = parser.parse_args()
+    if args.self_check:
+        raise SystemExit(0 if self_check() else 1)
 
-    results = {"DP": [], "DPLL": [], "CDCL": []}
+    # Seeds are derived here and handed to each job, so they reach the workers
+    # whatever the process start method, and no two CDCL runs share a stream
+    instance_seed, solver_seed = np.random.SeedSequence(args.seed).spawn(2)
+    instance_rng = np.random.default_rng(instance_seed)
 
-    for n in range(args.min, args.max + 1):
-        if args.test == "pigeonhole":
-            filename = f"ph_{n}.cnf"
-            generate_pigeonhole_cnf(n, filename)
-        else:
-            filename = f"3sat_{n}.cnf"
-            generate_random_3sat(n * 3, n * 5, filename)  # 3-SAT formula size
-
-        clauses, num_vars = parse_dimacs(filename)
-
-        for solver_func, name in [(dp, "DP"), (dpll, "DPLL"), (cdcl, "CDCL")]:
-            solver_name, result, time_taken = benchmark_solver(solver_func, clauses, num_vars, name)
+    results = {"DP": [], "DPLL": [], "CDCL": []}
+    solvers = {"DP": dp, "DPLL": dpll, "CDCL": cdcl_csr if args.cnf else cdcl}
+
+    jobs = []
+    if args.cnf:
+        # CDCL takes the parsed CSR arrays as-is; the size column is the variable count
+        lits, starts, num_vars = parse_dimacs_csr(args.cnf)
+        clauses = csr_to_clauses(lits, starts)
+        jobs.extend((num_vars, name, (lits, starts) if name == "CDCL" else clauses, num_vars) for name in solvers)
+    else:
+        for n in range(args.min, args.max + 1):
+            if args.test == "pigeonhole":
+                filename = f"ph_{n}.cnf" if args.write_dimacs else None
+                clauses, num_vars = generate_pigeonhole_cnf(n, filename)
+            else:
+                filename = f"3sat_{n}.cnf" if args.write_dimacs else None
+                clauses, num_vars = generate_random_3sat(n * 3, n * 5, filename, instance_rng)  # 3-SAT formula size
+            jobs.extend((n, name, clauses, num_vars) for name in solvers)
+
+    # Every (size, solver) run is independent, so they all go to the pool at once;
+    # with --jobs > 1 the reported times include contention between runs
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=warm_up_jit) as pool:
+        futures = {pool.submit(benchmark_solver, solvers[name], clauses, num_vars, name, seed): n
+                   for (n, name, clauses, num_vars), seed in zip(jobs, solver_seed.spawn(len(jobs)))}
+        for future in as_completed(futures):
+            n = futures[future]
+            solver_name, result, time_taken = future.result()
             print(f"{solver_name} | Size {n}: {result} in {time_taken:.6f}s")
-            results[name].append((n, time_taken))
+            results[solver_name].append((n, time_taken))
 
-    plot_results(results)
-    export_results(results)
+    for timings in results.values():
+        timings.sort()
 
-    # Clean up generated files
-    for n in range(args.min, args.max + 1):
-        try:
-            os.remove(f"ph_{n}.cnf")
-            os.remove(f"3sat_{n}.cnf")
-        except FileNotFoundError:
-            pass
+    # A plot over fewer than three sizes is not worth opening a window for
+    if not args.no_plot and not args.cnf and args.max - args.min >= 2:
+        plot_results(results)
+    export_results(results)